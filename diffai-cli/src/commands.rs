@@ -30,29 +30,6 @@ pub fn build_diff_options(args: &Args) -> Result<DiffOptions> {
     })
 }
 
-fn build_diff_options_for_values(args: &Args) -> Result<DiffOptions> {
-    let ignore_keys_regex = if let Some(pattern) = &args.ignore_keys_regex {
-        Some(Regex::new(pattern)?)
-    } else {
-        None
-    };
-
-    let output_format = if let Some(format_str) = &args.output {
-        Some(OutputFormat::parse_format(format_str)?)
-    } else {
-        None
-    };
-
-    Ok(DiffOptions {
-        epsilon: args.epsilon,
-        array_id_key: args.array_id_key.clone(),
-        ignore_keys_regex,
-        path_filter: args.path.clone(),
-        output_format,
-        // lawkitパターン：オプションは削除、最適化は常に有効
-    })
-}
-
 pub fn handle_stdin_input(args: &Args, input1_is_stdin: bool, input2_is_stdin: bool) -> Result<()> {
     if input1_is_stdin && input2_is_stdin {
         // Case 2 & 3: Both inputs from stdin - read two data sets from stdin
@@ -80,7 +57,7 @@ pub fn handle_stdin_input(args: &Args, input1_is_stdin: bool, input2_is_stdin: b
     let v2: Value = parse_content(&content2, input_format)?;
 
     // Build options and perform diff
-    let options = build_diff_options_for_values(args)?;
+    let options = build_diff_options(args)?;
     let differences = diff(&v1, &v2, Some(&options))?;
 
     // Handle output
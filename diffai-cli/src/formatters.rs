@@ -7,7 +7,7 @@ use crate::cli::Args;
 pub fn handle_output_and_exit(differences: &[DiffResult], args: &Args) -> Result<()> {
     // Handle quiet mode
     if args.quiet {
-        std::process::exit(if differences.is_empty() { 0 } else { 1 });
+        exit_with_status(differences);
     }
 
     // Handle brief mode
@@ -19,25 +19,10 @@ pub fn handle_output_and_exit(differences: &[DiffResult], args: &Args) -> Result
         } else {
             println!("Inputs differ");
         }
-        std::process::exit(if differences.is_empty() { 0 } else { 1 });
+        exit_with_status(differences);
     }
 
-    // Format and output results
-    let output_format = if let Some(format_str) = &args.output {
-        OutputFormat::parse_format(format_str)?
-    } else {
-        OutputFormat::Diffai
-    };
-    let formatted_output = format_output(differences, output_format)?;
-
-    if !formatted_output.trim().is_empty() {
-        println!("{formatted_output}");
-    } else if args.verbose {
-        println!("No differences found");
-    }
-
-    // Exit with appropriate code (0 = no differences, 1 = differences found)
-    std::process::exit(if differences.is_empty() { 0 } else { 1 });
+    print_results_and_exit(differences, args)
 }
 
 pub fn handle_file_output_and_exit(
@@ -48,7 +33,7 @@ pub fn handle_file_output_and_exit(
 ) -> Result<()> {
     // Handle quiet mode
     if args.quiet {
-        std::process::exit(if differences.is_empty() { 0 } else { 1 });
+        exit_with_status(differences);
     }
 
     // Handle brief mode
@@ -64,10 +49,14 @@ pub fn handle_file_output_and_exit(
         } else {
             println!("Files {} and {} differ", file1.display(), file2.display());
         }
-        std::process::exit(if differences.is_empty() { 0 } else { 1 });
+        exit_with_status(differences);
     }
 
-    // Format and output results
+    print_results_and_exit(differences, args)
+}
+
+// Format and output results (shared by stdin and file comparisons)
+fn print_results_and_exit(differences: &[DiffResult], args: &Args) -> Result<()> {
     let output_format = if let Some(format_str) = &args.output {
         OutputFormat::parse_format(format_str)?
     } else {
@@ -81,6 +70,10 @@ pub fn handle_file_output_and_exit(
         println!("No differences found");
     }
 
-    // Exit with appropriate code (0 = no differences, 1 = differences found)
+    exit_with_status(differences)
+}
+
+// Exit with appropriate code (0 = no differences, 1 = differences found)
+fn exit_with_status(differences: &[DiffResult]) -> ! {
     std::process::exit(if differences.is_empty() { 0 } else { 1 });
 }
@@ -19,6 +19,16 @@ pub fn read_input(file_path: &PathBuf) -> Result<String> {
     }
 }
 
+// 拡張子と入力形式の対応表（小文字化したStringを作らずに照合する）
+const EXTENSION_FORMATS: &[(&str, Format)] = &[
+    ("pt", Format::Pytorch),
+    ("pth", Format::Pytorch),
+    ("safetensors", Format::Safetensors),
+    ("npy", Format::Numpy),
+    ("npz", Format::Numpy),
+    ("mat", Format::Matlab),
+];
+
 pub fn infer_format_from_path(path: &Path) -> Option<Format> {
     if path.to_str() == Some("-") {
         // Cannot infer format from stdin, user must specify --format
@@ -26,12 +36,11 @@ pub fn infer_format_from_path(path: &Path) -> Option<Format> {
     } else {
         path.extension()
             .and_then(|ext| ext.to_str())
-            .and_then(|ext_str| match ext_str.to_lowercase().as_str() {
-                "pt" | "pth" => Some(Format::Pytorch),
-                "safetensors" => Some(Format::Safetensors),
-                "npy" | "npz" => Some(Format::Numpy),
-                "mat" => Some(Format::Matlab),
-                _ => None,
+            .and_then(|ext_str| {
+                EXTENSION_FORMATS
+                    .iter()
+                    .find(|(ext, _)| ext_str.eq_ignore_ascii_case(ext))
+                    .map(|&(_, format)| format)
             })
     }
 }
@@ -41,11 +41,7 @@ fn main() -> Result<()> {
     let options = build_diff_options(&args)?;
 
     // Perform diff using paths (automatic file/directory detection)
-    let results = diff_paths(
-        &input1.to_string_lossy(),
-        &input2.to_string_lossy(),
-        Some(&options),
-    )?;
+    let results = diff_paths(input1, input2, Some(&options))?;
 
     // Handle output and exit
     handle_file_output_and_exit(&results, &args, input1, input2)
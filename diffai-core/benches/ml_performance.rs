@@ -37,24 +37,12 @@ fn benchmark_ml_model_comparison(c: &mut Criterion) {
         let comparison_name = format!("{}_{}", name1, name2);
 
         group.bench_function(format!("basic_comparison_{}", comparison_name), |b| {
-            b.iter(|| {
-                black_box(diff_paths(
-                    &model1_path.to_string_lossy(),
-                    &model2_path.to_string_lossy(),
-                    None,
-                ))
-            })
+            b.iter(|| black_box(diff_paths(model1_path, model2_path, None)))
         });
 
         // Benchmark with AI/ML specific options
         group.bench_function(format!("advanced_features_{}", comparison_name), |b| {
-            b.iter(|| {
-                black_box(diff_paths(
-                    &model1_path.to_string_lossy(),
-                    &model2_path.to_string_lossy(),
-                    None,
-                ))
-            })
+            b.iter(|| black_box(diff_paths(model1_path, model2_path, None)))
         });
     }
 
@@ -106,13 +94,7 @@ fn benchmark_real_models(c: &mut Criterion) {
         let model2_path = available_models[1];
 
         group.bench_function("real_model_comparison", |b| {
-            b.iter(|| {
-                black_box(diff_paths(
-                    &model1_path.to_string_lossy(),
-                    &model2_path.to_string_lossy(),
-                    None,
-                ))
-            })
+            b.iter(|| black_box(diff_paths(model1_path, model2_path, None)))
         });
     }
 
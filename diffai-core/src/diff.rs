@@ -27,25 +27,30 @@ use crate::types::{DiffOptions, DiffResult, TensorStats};
 /// - Directory vs Directory: Recursive directory comparison  
 /// - File vs Directory: Returns error
 pub fn diff_paths(
-    old_path: &str,
-    new_path: &str,
+    old_path: impl AsRef<Path>,
+    new_path: impl AsRef<Path>,
     options: Option<&DiffOptions>,
 ) -> Result<Vec<DiffResult>> {
-    let path1 = Path::new(old_path);
-    let path2 = Path::new(new_path);
+    let path1 = old_path.as_ref();
+    let path2 = new_path.as_ref();
+
+    let default_options = DiffOptions::default();
+    let opts = options.unwrap_or(&default_options);
+    // diffx-core用オプションは一度だけ変換し、ディレクトリ内の全ファイルで共有する
+    let base_opts = convert_to_base_options(opts);
 
     match (path1.is_dir(), path2.is_dir()) {
-        (true, true) => diff_directories(path1, path2, options),
-        (false, false) => diff_files(path1, path2, options),
+        (true, true) => diff_directories(path1, path2, &base_opts),
+        (false, false) => diff_files(path1, path2, &base_opts),
         (true, false) => Err(anyhow!(
             "Cannot compare directory '{}' with file '{}'",
-            old_path,
-            new_path
+            path1.display(),
+            path2.display()
         )),
         (false, true) => Err(anyhow!(
             "Cannot compare file '{}' with directory '{}'",
-            old_path,
-            new_path
+            path1.display(),
+            path2.display()
         )),
     }
 }
@@ -58,17 +63,20 @@ pub fn diff(old: &Value, new: &Value, options: Option<&DiffOptions>) -> Result<V
     let default_options = DiffOptions::default();
     let opts = options.unwrap_or(&default_options);
 
-    // diffx-coreの基本diff機能を活用してコード重複を削減
     let base_opts = convert_to_base_options(opts);
-    let base_results = base_diff(old, new, Some(&base_opts))?;
+    diff_values(old, new, &base_opts)
+}
+
+// 変換済みのdiffx-coreオプションを受け取るdiff本体
+fn diff_values(old: &Value, new: &Value, base_opts: &BaseDiffOptions) -> Result<Vec<DiffResult>> {
+    // diffx-coreの基本diff機能を活用してコード重複を削減
+    let base_results = base_diff(old, new, Some(base_opts))?;
 
     // diffx-coreの結果をdiffai形式に変換
     let mut results: Vec<DiffResult> = base_results.into_iter().map(|r| r.into()).collect();
 
-    // AI/ML分析が有効な場合のみ追加処理を実行
-    if should_analyze_ml_features(old, new, opts) {
-        analyze_ml_features(old, new, &mut results, opts)?;
-    }
+    // lawkitパターン：ML分析は常に実行（ファイル形式に応じて各分析が自動判定）
+    analyze_ml_features(old, new, &mut results)?;
 
     Ok(results)
 }
@@ -86,75 +94,8 @@ fn convert_to_base_options(opts: &DiffOptions) -> BaseDiffOptions {
     }
 }
 
-// AI/ML分析が必要かどうかを判定
-fn should_analyze_ml_features(old: &Value, new: &Value, _opts: &DiffOptions) -> bool {
-    // lawkitパターン：MLファイル形式なら常に分析実行
-    if let (Value::Object(old_obj), Value::Object(new_obj)) = (old, new) {
-        // PyTorchファイル構造のキーが含まれている場合
-        let pytorch_keys = [
-            "binary_size",
-            "file_size",
-            "detected_components",
-            "estimated_layers",
-            "structure_fingerprint",
-            "pickle_protocol",
-            "state_dict",
-            "model",
-            "optimizer",
-            "scheduler",
-            "epoch",
-            "loss",
-            "accuracy",
-        ];
-        for key in &pytorch_keys {
-            if old_obj.contains_key(*key) || new_obj.contains_key(*key) {
-                return true;
-            }
-        }
-
-        // SafeTensorsファイル構造のキーが含まれている場合
-        let safetensors_keys = ["tensors"];
-        for key in &safetensors_keys {
-            if old_obj.contains_key(*key) || new_obj.contains_key(*key) {
-                return true;
-            }
-        }
-
-        // テンソル関連のキーが含まれている場合（直接のテンソル名）
-        let tensor_keys = [
-            "weight",
-            "bias",
-            "running_mean",
-            "running_var",
-            "num_batches_tracked",
-        ];
-        for (key, _) in old_obj.iter().chain(new_obj.iter()) {
-            for tensor_key in &tensor_keys {
-                if key.contains(tensor_key) {
-                    return true;
-                }
-            }
-        }
-
-        // テンソル階層構造の検出 (tensors.layer.weight パターン)
-        for (key, _) in old_obj.iter().chain(new_obj.iter()) {
-            if key.starts_with("tensors.") || key.contains(".weight") || key.contains(".bias") {
-                return true;
-            }
-        }
-    }
-
-    // ML関連のファイルは基本的に分析対象とする
-    true
-}
-
 // ML特徴分析を実行する統合関数
-fn analyze_ml_features(
-    old: &Value,
-    new: &Value,
-    results: &mut Vec<DiffResult>,
-    _options: &DiffOptions,
-) -> Result<()> {
+fn analyze_ml_features(old: &Value, new: &Value, results: &mut Vec<DiffResult>) -> Result<()> {
     // lawkitパターン：ML分析は常に実行（ファイル形式に応じて自動判定）
     if let (Value::Object(old_obj), Value::Object(new_obj)) = (old, new) {
         // state_dictなどのテンソル変更を分析
@@ -193,11 +134,7 @@ fn analyze_ml_features(
     Ok(())
 }
 
-fn diff_files(
-    path1: &Path,
-    path2: &Path,
-    options: Option<&DiffOptions>,
-) -> Result<Vec<DiffResult>> {
+fn diff_files(path1: &Path, path2: &Path, base_opts: &BaseDiffOptions) -> Result<Vec<DiffResult>> {
     // Detect formats based on file extensions
     let format1 = detect_format_from_path(path1)?;
     let format2 = detect_format_from_path(path2)?;
@@ -216,13 +153,13 @@ fn diff_files(
     let value2 = parse_file_by_format(path2, format2)?;
 
     // Use existing diff implementation
-    diff(&value1, &value2, options)
+    diff_values(&value1, &value2, base_opts)
 }
 
 fn diff_directories(
     dir1: &Path,
     dir2: &Path,
-    options: Option<&DiffOptions>,
+    base_opts: &BaseDiffOptions,
 ) -> Result<Vec<DiffResult>> {
     let mut results = Vec::new();
 
@@ -274,54 +211,12 @@ fn diff_directories(
     // Find files that exist in both directories (compare contents)
     for (rel_path, abs_path1) in &files1_map {
         if let Some(abs_path2) = files2_map.get(rel_path) {
-            match diff_files(abs_path1, abs_path2, options) {
+            match diff_files(abs_path1, abs_path2, base_opts) {
                 Ok(mut file_results) => {
                     // Prefix all paths with the relative path
+                    let prefix = format!("{rel_path}/");
                     for result in &mut file_results {
-                        match result {
-                            DiffResult::Added(path, _) => *path = format!("{rel_path}/{path}"),
-                            DiffResult::Removed(path, _) => *path = format!("{rel_path}/{path}"),
-                            DiffResult::Modified(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::TypeChanged(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            // AI/ML specific result types
-                            DiffResult::TensorShapeChanged(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::TensorStatsChanged(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::TensorDataChanged(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::ModelArchitectureChanged(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::WeightSignificantChange(path, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::ActivationFunctionChanged(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::LearningRateChanged(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::OptimizerChanged(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::LossChange(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::AccuracyChange(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                            DiffResult::ModelVersionChanged(path, _, _) => {
-                                *path = format!("{rel_path}/{path}")
-                            }
-                        }
+                        result.path_mut().insert_str(0, &prefix);
                     }
                     results.extend(file_results);
                 }
@@ -339,13 +234,19 @@ fn diff_directories(
 fn get_all_files_recursive(dir: &Path) -> Result<Vec<std::path::PathBuf>> {
     let mut files = Vec::new();
 
-    if dir.is_dir() {
-        for entry in fs::read_dir(dir)? {
+    if !dir.is_dir() {
+        return Ok(files);
+    }
+
+    // 再帰呼び出しごとの中間Vecを作らず、明示的なスタックで走査する
+    let mut pending_dirs = vec![dir.to_path_buf()];
+    while let Some(current) = pending_dirs.pop() {
+        for entry in fs::read_dir(&current)? {
             let entry = entry?;
             let path = entry.path();
 
             if path.is_dir() {
-                files.extend(get_all_files_recursive(&path)?);
+                pending_dirs.push(path);
             } else if path.is_file() {
                 files.push(path);
             }
@@ -430,7 +331,8 @@ pub fn extract_tensor_data(tensor: &Value) -> Option<Vec<f64>> {
     match tensor {
         // Direct array format (NumPy, simple tensors)
         Value::Array(arr) => {
-            let mut data = Vec::new();
+            // 1次元配列なら要素数ちょうど、多次元でも最上位の要素数分は先に確保しておく
+            let mut data = Vec::with_capacity(arr.len());
             extract_numbers_from_nested_array(arr, &mut data);
             if !data.is_empty() {
                 Some(data)
@@ -541,11 +443,11 @@ fn extract_flattened_tensor_values(
     let storage_fields = ["_storage", "storage", "_data"];
     for field in &storage_fields {
         if let Some(storage_value) = obj.get(*field) {
-            if let Some(data) = extract_tensor_data(storage_value) {
-                // Limit to expected number of elements
-                let limited_data: Vec<f64> = data.into_iter().take(total_elements).collect();
-                if !limited_data.is_empty() {
-                    return Some(limited_data);
+            if let Some(mut data) = extract_tensor_data(storage_value) {
+                // Limit to expected number of elements (in place, keeping the allocation)
+                data.truncate(total_elements);
+                if !data.is_empty() {
+                    return Some(data);
                 }
             }
         }
@@ -621,16 +523,17 @@ fn analyze_tensor_metadata_changes(
     results: &mut Vec<DiffResult>,
 ) {
     if let (Value::Object(old_obj), Value::Object(new_obj)) = (old_item, new_item) {
-        // Check for shape changes
-        if let (Some(old_shape), Some(new_shape)) = (old_obj.get("shape"), new_obj.get("shape")) {
-            let old_shape_vec = extract_shape_from_value(old_shape);
-            let new_shape_vec = extract_shape_from_value(new_shape);
+        // shapeは形状比較と統計計算の両方で使うため、先に一度だけ取り出す
+        let old_shape = old_obj.get("shape").map(extract_shape_from_value);
+        let new_shape = new_obj.get("shape").map(extract_shape_from_value);
 
+        // Check for shape changes
+        if let (Some(old_shape_vec), Some(new_shape_vec)) = (&old_shape, &new_shape) {
             if old_shape_vec != new_shape_vec {
                 results.push(DiffResult::TensorShapeChanged(
                     path.to_string(),
-                    old_shape_vec,
-                    new_shape_vec,
+                    old_shape_vec.clone(),
+                    new_shape_vec.clone(),
                 ));
             }
         }
@@ -653,26 +556,21 @@ fn analyze_tensor_metadata_changes(
         if let (Some(Value::Array(old_data)), Some(Value::Array(new_data))) =
             (old_obj.get("data"), new_obj.get("data"))
         {
-            let old_vals: Vec<f64> = old_data.iter().filter_map(|v| v.as_f64()).collect();
-            let new_vals: Vec<f64> = new_data.iter().filter_map(|v| v.as_f64()).collect();
+            let mut old_vals = Vec::with_capacity(old_data.len());
+            old_vals.extend(old_data.iter().filter_map(|v| v.as_f64()));
+            let mut new_vals = Vec::with_capacity(new_data.len());
+            new_vals.extend(new_data.iter().filter_map(|v| v.as_f64()));
 
             if !old_vals.is_empty() && !new_vals.is_empty() {
-                let old_shape = old_obj
-                    .get("shape")
-                    .map(extract_shape_from_value)
-                    .unwrap_or_default();
-                let new_shape = new_obj
-                    .get("shape")
-                    .map(extract_shape_from_value)
-                    .unwrap_or_default();
                 let dtype = old_obj
                     .get("dtype")
                     .and_then(|d| d.as_str())
                     .unwrap_or("float32")
                     .to_string();
 
-                let old_stats = TensorStats::new(&old_vals, old_shape.clone(), dtype.clone());
-                let new_stats = TensorStats::new(&new_vals, new_shape, dtype);
+                let old_stats =
+                    TensorStats::new(&old_vals, old_shape.unwrap_or_default(), dtype.clone());
+                let new_stats = TensorStats::new(&new_vals, new_shape.unwrap_or_default(), dtype);
 
                 if stats_changed_significantly(&old_stats, &new_stats) {
                     results.push(DiffResult::TensorStatsChanged(
@@ -1,6 +1,5 @@
 use serde_json::Value;
 
-use super::statistics::{estimate_gradient_norm_from_weights, estimate_max_gradient_from_weights};
 use super::types::GradientFlowInfo;
 
 // Analyze gradient flow through network layers
@@ -75,16 +74,9 @@ pub(super) fn extract_gradient_flow_info(
     let mut vanishing_layers = 0;
     let mut exploding_layers = 0;
 
-    // Use weight-based gradient estimation as fallback
-    let _estimated_norm = estimate_gradient_norm_from_weights(obj);
-    let _estimated_max = estimate_max_gradient_from_weights(obj);
-    #[allow(unused_assignments)]
-    let mut flow_balance = None;
-
     // Enhanced thresholds based on modern deep learning practices
     let vanishing_threshold = 1e-7; // More sensitive
     let exploding_threshold = 5.0; // More conservative
-    let _moderate_exploding_threshold = 1.0;
 
     let mut layer_gradients = Vec::new();
 
@@ -151,7 +143,7 @@ pub(super) fn extract_gradient_flow_info(
     }
 
     // Enhanced flow balance estimation
-    flow_balance = estimate_gradient_flow_balance(obj);
+    let flow_balance = estimate_gradient_flow_balance(obj);
 
     // Additional validation: check gradient magnitude distribution
     if !layer_gradients.is_empty() {
@@ -175,7 +167,8 @@ pub(super) fn extract_gradient_flow_info(
 
 // Enhanced gradient flow balance estimation using lawkit streaming patterns
 pub(super) fn estimate_gradient_flow_balance(obj: &serde_json::Map<String, Value>) -> Option<f64> {
-    let mut layer_gradients = Vec::new();
+    // レイヤー名は並び替えにしか使わないため、キーをコピーせず借用する
+    let mut layer_gradients: Vec<(&str, f64)> = Vec::new();
     let mut total_forward_flow = 0.0;
     let mut total_backward_flow = 0.0;
     let mut layer_count = 0;
@@ -193,7 +186,7 @@ pub(super) fn estimate_gradient_flow_balance(obj: &serde_json::Map<String, Value
             match value {
                 Value::Number(num) => {
                     if let Some(val) = num.as_f64() {
-                        layer_gradients.push((key.clone(), val.abs()));
+                        layer_gradients.push((key.as_str(), val.abs()));
                     }
                 }
                 Value::Array(arr) => {
@@ -209,13 +202,13 @@ pub(super) fn estimate_gradient_flow_balance(obj: &serde_json::Map<String, Value
                         }
                     }
                     if count > 0 {
-                        layer_gradients.push((key.clone(), sum / count as f64));
+                        layer_gradients.push((key.as_str(), sum / count as f64));
                     }
                 }
                 Value::Object(nested) => {
                     // Recursive analysis for nested layer structures
                     if let Some(nested_flow) = estimate_gradient_flow_balance(nested) {
-                        layer_gradients.push((key.clone(), nested_flow));
+                        layer_gradients.push((key.as_str(), nested_flow));
                     }
                 }
                 _ => {}
@@ -1,15 +1,10 @@
-use serde_json::Value;
-
-use super::statistics::extract_gradient_statistics;
+use super::types::GradientStatistics;
 
 // Analyze gradient magnitude patterns
 pub(super) fn analyze_gradient_magnitudes(
-    old_obj: &serde_json::Map<String, Value>,
-    new_obj: &serde_json::Map<String, Value>,
+    old_grad_stats: &GradientStatistics,
+    new_grad_stats: &GradientStatistics,
 ) -> Option<(String, String)> {
-    let old_grad_stats = extract_gradient_statistics(old_obj)?;
-    let new_grad_stats = extract_gradient_statistics(new_obj)?;
-
     let mut magnitude_analysis = Vec::new();
 
     // Compare gradient norms
@@ -13,6 +13,7 @@ mod types;
 use distributions::analyze_gradient_distributions;
 use flow::analyze_gradient_flow;
 use magnitudes::analyze_gradient_magnitudes;
+use statistics::extract_gradient_statistics;
 
 // A4-3: GRADIENT ANALYSIS - Medium Priority ML Feature
 // ============================================================================
@@ -24,22 +25,30 @@ pub fn analyze_gradient_patterns(
     results: &mut Vec<DiffResult>,
 ) {
     if let (Value::Object(old_obj), Value::Object(new_obj)) = (old_model, new_model) {
-        // Gradient magnitude analysis
-        if let Some((old_mag, new_mag)) = analyze_gradient_magnitudes(old_obj, new_obj) {
-            results.push(DiffResult::ModelArchitectureChanged(
-                "gradient_magnitudes".to_string(),
-                old_mag,
-                new_mag,
-            ));
-        }
+        // 勾配統計は重みを全走査するため、モデルごとに一度だけ計算して共有する
+        if let (Some(old_stats), Some(new_stats)) = (
+            extract_gradient_statistics(old_obj),
+            extract_gradient_statistics(new_obj),
+        ) {
+            // Gradient magnitude analysis
+            if let Some((old_mag, new_mag)) = analyze_gradient_magnitudes(&old_stats, &new_stats) {
+                results.push(DiffResult::ModelArchitectureChanged(
+                    "gradient_magnitudes".to_string(),
+                    old_mag,
+                    new_mag,
+                ));
+            }
 
-        // Gradient distribution analysis
-        if let Some((old_dist, new_dist)) = analyze_gradient_distributions(old_obj, new_obj) {
-            results.push(DiffResult::ModelArchitectureChanged(
-                "gradient_distributions".to_string(),
-                old_dist,
-                new_dist,
-            ));
+            // Gradient distribution analysis
+            if let Some((old_dist, new_dist)) =
+                analyze_gradient_distributions(&old_stats, &new_stats)
+            {
+                results.push(DiffResult::ModelArchitectureChanged(
+                    "gradient_distributions".to_string(),
+                    old_dist,
+                    new_dist,
+                ));
+            }
         }
 
         // Gradient flow analysis
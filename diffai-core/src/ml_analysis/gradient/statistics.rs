@@ -143,20 +143,6 @@ pub(super) fn compute_enhanced_gradient_statistics(
     }
 }
 
-// Legacy function for backward compatibility
-pub(super) fn estimate_gradient_norm_from_weights(
-    obj: &serde_json::Map<String, Value>,
-) -> Option<f64> {
-    compute_enhanced_gradient_statistics(obj).total_norm
-}
-
-// Legacy function for backward compatibility
-pub(super) fn estimate_max_gradient_from_weights(
-    obj: &serde_json::Map<String, Value>,
-) -> Option<f64> {
-    compute_enhanced_gradient_statistics(obj).max_gradient
-}
-
 // Memory-efficient streaming sparsity calculation
 fn estimate_gradient_sparsity_streaming(obj: &serde_json::Map<String, Value>) -> Option<f64> {
     let mut near_zero_count = 0;
@@ -270,12 +256,12 @@ fn count_gradient_outliers_robust(obj: &serde_json::Map<String, Value>) -> Optio
     }
 
     // IQR method for additional validation
-    let mut sorted_values = values.clone();
-    sorted_values.sort_by(|a, b| a.partial_cmp(b).unwrap());
-    let len = sorted_values.len();
+    // The outlier count below is order-independent, so sort in place rather than copying
+    values.sort_by(|a, b| a.partial_cmp(b).unwrap());
+    let len = values.len();
     if len >= 4 {
-        let q1 = sorted_values[len / 4];
-        let q3 = sorted_values[3 * len / 4];
+        let q1 = values[len / 4];
+        let q3 = values[3 * len / 4];
         let iqr = q3 - q1;
         let lower_bound = q1 - iqr_multiplier * iqr;
         let upper_bound = q3 + iqr_multiplier * iqr;
@@ -12,18 +12,9 @@ pub fn analyze_memory_usage_changes(
     let new_memory = calculate_model_memory_usage(new_model);
 
     if old_memory != new_memory {
-        // Create a comprehensive memory analysis result
         let memory_change = new_memory as f64 - old_memory as f64;
-        let memory_change_percent = if old_memory > 0 {
-            (memory_change / old_memory as f64) * 100.0
-        } else {
-            0.0
-        };
 
         // Use ModelArchitectureChanged variant for memory analysis
-        let _memory_analysis =
-            format!("memory: {old_memory} → {new_memory} bytes ({memory_change_percent:+.1}%)");
-
         results.push(DiffResult::ModelArchitectureChanged(
             "memory_analysis".to_string(),
             format!("memory_usage: {old_memory} bytes"),
@@ -1,5 +1,6 @@
 use anyhow::Result;
 use diffx_core::format_diff_output;
+use std::fmt::Write as _;
 
 use crate::types::{DiffResult, OutputFormat};
 
@@ -27,26 +28,39 @@ pub fn format_diff_results(results: &[DiffResult], format: OutputFormat) -> Resu
         }
         OutputFormat::Diffai => {
             // Diffai形式では基本型をdiffx-coreでフォーマット、ML型は手動フォーマット
-            let base_results: Vec<diffx_core::DiffResult> = results
-                .iter()
-                .filter_map(|r| match r {
-                    DiffResult::Added(path, value) => {
-                        Some(diffx_core::DiffResult::Added(path.clone(), value.clone()))
-                    }
-                    DiffResult::Removed(path, value) => {
-                        Some(diffx_core::DiffResult::Removed(path.clone(), value.clone()))
-                    }
-                    DiffResult::Modified(path, old, new) => Some(diffx_core::DiffResult::Modified(
-                        path.clone(),
-                        old.clone(),
-                        new.clone(),
-                    )),
-                    DiffResult::TypeChanged(path, old, new) => Some(
+            // 1パスで基本型（diffx-coreでフォーマット）とML型に振り分ける
+            let mut base_results: Vec<diffx_core::DiffResult> = Vec::new();
+            let mut ml_results: Vec<&DiffResult> = Vec::new();
+            for result in results {
+                match result {
+                    DiffResult::Added(path, value) => base_results
+                        .push(diffx_core::DiffResult::Added(path.clone(), value.clone())),
+                    DiffResult::Removed(path, value) => base_results
+                        .push(diffx_core::DiffResult::Removed(path.clone(), value.clone())),
+                    DiffResult::Modified(path, old, new) => base_results.push(
+                        diffx_core::DiffResult::Modified(path.clone(), old.clone(), new.clone()),
+                    ),
+                    DiffResult::TypeChanged(path, old, new) => base_results.push(
                         diffx_core::DiffResult::TypeChanged(path.clone(), old.clone(), new.clone()),
                     ),
-                    _ => None,
-                })
-                .collect();
+                    // TensorStatsChanged: data_summaryの変更は既にJSON diffで表示されるため除外
+                    DiffResult::TensorStatsChanged(path, _, _) => {
+                        if !path.contains("data_summary") {
+                            ml_results.push(result);
+                        }
+                    }
+                    DiffResult::TensorShapeChanged(_, _, _)
+                    | DiffResult::TensorDataChanged(_, _, _)
+                    | DiffResult::ModelArchitectureChanged(_, _, _)
+                    | DiffResult::WeightSignificantChange(_, _)
+                    | DiffResult::ActivationFunctionChanged(_, _, _)
+                    | DiffResult::LearningRateChanged(_, _, _)
+                    | DiffResult::OptimizerChanged(_, _, _)
+                    | DiffResult::LossChange(_, _, _)
+                    | DiffResult::AccuracyChange(_, _, _)
+                    | DiffResult::ModelVersionChanged(_, _, _) => ml_results.push(result),
+                }
+            }
 
             let mut output = String::new();
 
@@ -57,58 +71,35 @@ pub fn format_diff_results(results: &[DiffResult], format: OutputFormat) -> Resu
                 output.push_str(&formatted);
             }
 
-            // AI/ML専用型を追加（data_summaryの変更は既にJSON diffで表示されるため除外）
-            let ml_results: Vec<&DiffResult> = results
-                .iter()
-                .filter(|r| {
-                    match r {
-                        // TensorStatsChanged: data_summaryパスは除外（重複回避）
-                        DiffResult::TensorStatsChanged(path, _, _) => {
-                            !path.contains("data_summary")
-                        }
-                        DiffResult::TensorShapeChanged(_, _, _)
-                        | DiffResult::TensorDataChanged(_, _, _)
-                        | DiffResult::ModelArchitectureChanged(_, _, _)
-                        | DiffResult::WeightSignificantChange(_, _)
-                        | DiffResult::ActivationFunctionChanged(_, _, _)
-                        | DiffResult::LearningRateChanged(_, _, _)
-                        | DiffResult::OptimizerChanged(_, _, _)
-                        | DiffResult::LossChange(_, _, _)
-                        | DiffResult::AccuracyChange(_, _, _)
-                        | DiffResult::ModelVersionChanged(_, _, _) => true,
-                        _ => false,
-                    }
-                })
-                .collect();
-
             if !ml_results.is_empty() {
                 if !output.is_empty() && !output.ends_with('\n') {
                     output.push('\n');
                 }
                 output.push('\n');
 
+                // 1件ごとにStringを確保せず、出力バッファへ直接書き込む
                 for result in &ml_results {
                     match result {
                         DiffResult::ModelArchitectureChanged(path, old, new) => {
-                            output.push_str(&format!("  ~ {path}: {old} -> {new}\n"));
+                            writeln!(output, "  ~ {path}: {old} -> {new}")?;
                         }
                         DiffResult::TensorShapeChanged(path, old_shape, new_shape) => {
-                            output.push_str(&format!(
-                                "  ~ {path} shape: {old_shape:?} -> {new_shape:?}\n"
-                            ));
+                            writeln!(output, "  ~ {path} shape: {old_shape:?} -> {new_shape:?}")?;
                         }
                         DiffResult::TensorStatsChanged(path, old_stats, new_stats) => {
-                            output.push_str(&format!(
-                                "  ~ {} stats: mean {:.3} -> {:.3}\n",
+                            writeln!(
+                                output,
+                                "  ~ {} stats: mean {:.3} -> {:.3}",
                                 path, old_stats.mean, new_stats.mean
-                            ));
+                            )?;
                         }
                         _ => {
                             // その他のML型もサポート
-                            output.push_str(&format!(
-                                "  ~ ML analysis: {}\n",
+                            writeln!(
+                                output,
+                                "  ~ ML analysis: {}",
                                 serde_json::to_string(result)?
-                            ));
+                            )?;
                         }
                     }
                 }
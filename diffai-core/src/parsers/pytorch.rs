@@ -1,16 +1,14 @@
 use anyhow::Result;
+use regex::{Regex, RegexSet};
 use serde_json::Value;
-use std::fs::File;
-use std::io::Read;
 use std::path::Path;
+use std::sync::OnceLock;
 
 /// Parse PyTorch model file - FOR INTERNAL USE ONLY (diffai-specific)
 pub fn parse_pytorch_model(file_path: &Path) -> Result<Value> {
     // Parse PyTorch model file and convert to JSON representation
-    let file = File::open(file_path)?;
-    let mut reader = std::io::BufReader::new(file);
-    let mut buffer = Vec::new();
-    reader.read_to_end(&mut buffer)?;
+    // ファイルサイズ分を一括確保して読み込む（8KiBのBufReader経由のコピーを避ける）
+    let buffer = std::fs::read(file_path)?;
 
     // Extract comprehensive model structure information from PyTorch binary data
     // Uses advanced pattern matching and binary analysis for robust model parsing
@@ -41,16 +39,23 @@ fn extract_pytorch_model_info(buffer: &[u8]) -> serde_json::Map<String, Value> {
     // Look for null-terminated strings that match layer names
     let searchable_content = String::from_utf8_lossy(buffer);
 
-    // Count weight and bias parameters more accurately
-    let weight_count = searchable_content.matches("weight").count();
-    let bias_count = searchable_content.matches("bias").count();
-
-    // Look for layer-specific patterns
-    let conv_count = searchable_content.matches("conv").count();
-    let linear_count =
-        searchable_content.matches("linear").count() + searchable_content.matches("fc.").count();
-    let bn_count =
-        searchable_content.matches("bn").count() + searchable_content.matches("batch_norm").count();
+    // Count weight/bias parameters and layer-specific patterns in a single scan
+    // (パターン同士は重ならないため、個別にmatches().count()した場合と同じ件数になる)
+    let mut weight_count: usize = 0;
+    let mut bias_count: usize = 0;
+    let mut conv_count: usize = 0;
+    let mut linear_count: usize = 0;
+    let mut bn_count: usize = 0;
+    for m in layer_pattern_regex().find_iter(&searchable_content) {
+        match m.as_str() {
+            "weight" => weight_count += 1,
+            "bias" => bias_count += 1,
+            "conv" => conv_count += 1,
+            "linear" | "fc." => linear_count += 1,
+            "bn" | "batch_norm" => bn_count += 1,
+            _ => {}
+        }
+    }
 
     // Build layer information
     let mut detected_layers = Vec::new();
@@ -87,25 +92,16 @@ fn extract_pytorch_model_info(buffer: &[u8]) -> serde_json::Map<String, Value> {
     }
 
     // Look for model architecture signatures
-    let architectures = [
-        ("resnet", "ResNet"),
-        ("vgg", "VGG"),
-        ("densenet", "DenseNet"),
-        ("mobilenet", "MobileNet"),
-        ("efficientnet", "EfficientNet"),
-        ("transformer", "Transformer"),
-        ("bert", "BERT"),
-        ("gpt", "GPT"),
-    ];
-
-    for (pattern, arch_name) in &architectures {
-        if searchable_content.to_lowercase().contains(pattern) {
-            info.insert(
-                "detected_architecture".to_string(),
-                Value::String(arch_name.to_string()),
-            );
-            break;
-        }
+    // 大文字小文字を無視した1回の走査で判定し、複数一致時はリスト先頭側を優先する
+    if let Some(index) = architecture_regex_set()
+        .matches(&searchable_content)
+        .iter()
+        .next()
+    {
+        info.insert(
+            "detected_architecture".to_string(),
+            Value::String(ARCHITECTURES[index].1.to_string()),
+        );
     }
 
     // Look for optimizer state information (for training checkpoints)
@@ -146,6 +142,42 @@ fn extract_pytorch_model_info(buffer: &[u8]) -> serde_json::Map<String, Value> {
     info
 }
 
+// Model architecture signatures, in detection priority order
+const ARCHITECTURES: [(&str, &str); 8] = [
+    ("resnet", "ResNet"),
+    ("vgg", "VGG"),
+    ("densenet", "DenseNet"),
+    ("mobilenet", "MobileNet"),
+    ("efficientnet", "EfficientNet"),
+    ("transformer", "Transformer"),
+    ("bert", "BERT"),
+    ("gpt", "GPT"),
+];
+
+// ARCHITECTURESの各パターンを1つのRegexSetにまとめたもの（初回呼び出し時に1度だけ構築）
+// (?i-u)でASCIIのみ大文字小文字を無視し、to_lowercase().contains()と同じ判定にする
+// （(?i)だとUnicodeの大小文字畳み込みで "reſnet" なども一致してしまう）
+fn architecture_regex_set() -> &'static RegexSet {
+    static ARCHITECTURE_PATTERNS: OnceLock<RegexSet> = OnceLock::new();
+    ARCHITECTURE_PATTERNS.get_or_init(|| {
+        RegexSet::new(
+            ARCHITECTURES
+                .iter()
+                .map(|(pattern, _)| format!("(?i-u){pattern}")),
+        )
+        .expect("architecture pattern set is valid")
+    })
+}
+
+// Layer/parameter name alternation used to count components in one pass
+fn layer_pattern_regex() -> &'static Regex {
+    static LAYER_PATTERNS: OnceLock<Regex> = OnceLock::new();
+    LAYER_PATTERNS.get_or_init(|| {
+        Regex::new(r"weight|bias|conv|linear|fc\.|bn|batch_norm")
+            .expect("layer pattern regex is valid")
+    })
+}
+
 // Simple hash calculation for model structure fingerprinting
 fn calculate_simple_hash(content: &str) -> u64 {
     use std::collections::hash_map::DefaultHasher;
@@ -160,3 +192,55 @@ fn calculate_simple_hash(content: &str) -> u64 {
     structure_parts.hash(&mut hasher);
     hasher.finish()
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn detected_architecture(content: &[u8]) -> Option<String> {
+        extract_pytorch_model_info(content)
+            .get("detected_architecture")
+            .and_then(Value::as_str)
+            .map(str::to_string)
+    }
+
+    #[test]
+    fn test_detected_components_counts_each_layer_pattern() {
+        let info = extract_pytorch_model_info(b"conv1.weight fc.bias bn1 batch_norm linear");
+        assert_eq!(
+            info.get("detected_components").and_then(Value::as_str),
+            Some("convolution: 1, linear: 2, batch_norm: 2, weight_params: 1, bias_params: 1")
+        );
+        assert_eq!(
+            info.get("estimated_layers").and_then(Value::as_u64),
+            Some(1)
+        );
+    }
+
+    #[test]
+    fn test_detected_architecture_ignores_ascii_case() {
+        assert_eq!(
+            detected_architecture(b"model.ReSNeT50.layer1").as_deref(),
+            Some("ResNet")
+        );
+        assert_eq!(
+            detected_architecture(b"TRANSFORMER.encoder").as_deref(),
+            Some("Transformer")
+        );
+    }
+
+    #[test]
+    fn test_detected_architecture_ignores_unicode_case_folding() {
+        // U+017F (long s) folds to "s" only under Unicode rules
+        assert_eq!(detected_architecture("reſnet".as_bytes()), None);
+        assert_eq!(detected_architecture("TRANſFORMER".as_bytes()), None);
+    }
+
+    #[test]
+    fn test_detected_architecture_prefers_earlier_entry() {
+        assert_eq!(
+            detected_architecture(b"BERT encoder on a ResNet backbone").as_deref(),
+            Some("ResNet")
+        );
+    }
+}
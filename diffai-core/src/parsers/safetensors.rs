@@ -51,64 +51,79 @@ fn compute_tensor_stats(tensor: &safetensors::tensor::TensorView) -> Option<Valu
     let data = tensor.data();
     let dtype = tensor.dtype();
 
-    // Convert raw bytes to f64 values based on dtype
-    let values: Vec<f64> = match dtype {
+    // Summarize the raw typed slice directly instead of collecting an f64 copy of the tensor
+    match dtype {
         Dtype::F32 => {
             let floats: &[f32] = bytemuck::cast_slice(data);
-            floats.iter().map(|&x| x as f64).collect()
+            summarize_values(floats.iter().map(|&x| x as f64))
         }
         Dtype::F64 => {
             let floats: &[f64] = bytemuck::cast_slice(data);
-            floats.to_vec()
+            summarize_values(floats.iter().copied())
         }
         Dtype::F16 => {
             // F16 needs special handling - use half crate or convert manually
             // For simplicity, skip F16 stats for now
-            return None;
+            None
         }
         Dtype::BF16 => {
             // BF16 needs special handling
-            return None;
+            None
         }
         Dtype::I32 => {
             let ints: &[i32] = bytemuck::cast_slice(data);
-            ints.iter().map(|&x| x as f64).collect()
+            summarize_values(ints.iter().map(|&x| x as f64))
         }
         Dtype::I64 => {
             let ints: &[i64] = bytemuck::cast_slice(data);
-            ints.iter().map(|&x| x as f64).collect()
+            summarize_values(ints.iter().map(|&x| x as f64))
         }
         Dtype::I16 => {
             let ints: &[i16] = bytemuck::cast_slice(data);
-            ints.iter().map(|&x| x as f64).collect()
+            summarize_values(ints.iter().map(|&x| x as f64))
         }
-        Dtype::I8 => data.iter().map(|&x| x as i8 as f64).collect(),
-        Dtype::U8 => data.iter().map(|&x| x as f64).collect(),
+        Dtype::I8 => summarize_values(data.iter().map(|&x| x as i8 as f64)),
+        Dtype::U8 => summarize_values(data.iter().map(|&x| x as f64)),
         Dtype::U16 => {
             let ints: &[u16] = bytemuck::cast_slice(data);
-            ints.iter().map(|&x| x as f64).collect()
+            summarize_values(ints.iter().map(|&x| x as f64))
         }
         Dtype::U32 => {
             let ints: &[u32] = bytemuck::cast_slice(data);
-            ints.iter().map(|&x| x as f64).collect()
+            summarize_values(ints.iter().map(|&x| x as f64))
         }
         Dtype::U64 => {
             let ints: &[u64] = bytemuck::cast_slice(data);
-            ints.iter().map(|&x| x as f64).collect()
+            summarize_values(ints.iter().map(|&x| x as f64))
         }
-        _ => return None,
-    };
+        _ => None,
+    }
+}
+
+// Two passes over the borrowed values: sum/min/max first, then the variance around the mean
+fn summarize_values<I>(values: I) -> Option<Value>
+where
+    I: Iterator<Item = f64> + Clone,
+{
+    let mut count = 0usize;
+    let mut sum = 0.0;
+    let mut min = f64::INFINITY;
+    let mut max = f64::NEG_INFINITY;
+    for x in values.clone() {
+        count += 1;
+        sum += x;
+        min = min.min(x);
+        max = max.max(x);
+    }
 
-    if values.is_empty() {
+    if count == 0 {
         return None;
     }
 
-    let n = values.len() as f64;
-    let mean = values.iter().sum::<f64>() / n;
-    let variance = values.iter().map(|x| (x - mean).powi(2)).sum::<f64>() / n;
+    let n = count as f64;
+    let mean = sum / n;
+    let variance = values.map(|x| (x - mean).powi(2)).sum::<f64>() / n;
     let std = variance.sqrt();
-    let min = values.iter().cloned().fold(f64::INFINITY, f64::min);
-    let max = values.iter().cloned().fold(f64::NEG_INFINITY, f64::max);
 
     Some(json!({
         "mean": mean,
@@ -32,6 +32,29 @@ pub enum DiffResult {
     ModelVersionChanged(String, String, String),          // path, old_version, new_version
 }
 
+impl DiffResult {
+    // 全バリアントの先頭フィールドはパス。種別ごとの分岐を呼び出し側に書かせない
+    pub(crate) fn path_mut(&mut self) -> &mut String {
+        match self {
+            DiffResult::Added(path, _)
+            | DiffResult::Removed(path, _)
+            | DiffResult::Modified(path, _, _)
+            | DiffResult::TypeChanged(path, _, _)
+            | DiffResult::TensorShapeChanged(path, _, _)
+            | DiffResult::TensorStatsChanged(path, _, _)
+            | DiffResult::TensorDataChanged(path, _, _)
+            | DiffResult::ModelArchitectureChanged(path, _, _)
+            | DiffResult::WeightSignificantChange(path, _)
+            | DiffResult::ActivationFunctionChanged(path, _, _)
+            | DiffResult::LearningRateChanged(path, _, _)
+            | DiffResult::OptimizerChanged(path, _, _)
+            | DiffResult::LossChange(path, _, _)
+            | DiffResult::AccuracyChange(path, _, _)
+            | DiffResult::ModelVersionChanged(path, _, _) => path,
+        }
+    }
+}
+
 // diffx-coreのDiffResultとの変換関数
 impl From<diffx_core::DiffResult> for DiffResult {
     fn from(result: diffx_core::DiffResult) -> Self {
@@ -74,11 +97,19 @@ impl TensorStats {
             };
         }
 
-        let mean = data.iter().sum::<f64>() / element_count as f64;
+        // 合計・最小・最大を1パスでまとめて求め、分散のみ2パス目で計算する
+        let mut sum = 0.0;
+        let mut min = f64::INFINITY;
+        let mut max = f64::NEG_INFINITY;
+        for &x in data {
+            sum += x;
+            min = min.min(x);
+            max = max.max(x);
+        }
+
+        let mean = sum / element_count as f64;
         let variance = data.iter().map(|x| (x - mean).powi(2)).sum::<f64>() / element_count as f64;
         let std = variance.sqrt();
-        let min = data.iter().fold(f64::INFINITY, |a, &b| a.min(b));
-        let max = data.iter().fold(f64::NEG_INFINITY, |a, &b| a.max(b));
 
         Self {
             mean,
@@ -127,11 +158,15 @@ impl OutputFormat {
     }
 
     pub fn parse_format(s: &str) -> Result<Self> {
-        match s.to_lowercase().as_str() {
-            "diffai" => Ok(Self::Diffai),
-            "json" => Ok(Self::Json),
-            "yaml" | "yml" => Ok(Self::Yaml),
-            _ => Err(anyhow!("Invalid output format: {}", s)),
+        // 小文字化したStringを作らず、ASCII大文字小文字を無視して比較する
+        if s.eq_ignore_ascii_case("diffai") {
+            Ok(Self::Diffai)
+        } else if s.eq_ignore_ascii_case("json") {
+            Ok(Self::Json)
+        } else if s.eq_ignore_ascii_case("yaml") || s.eq_ignore_ascii_case("yml") {
+            Ok(Self::Yaml)
+        } else {
+            Err(anyhow!("Invalid output format: {}", s))
         }
     }
 }
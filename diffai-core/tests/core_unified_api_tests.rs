@@ -429,6 +429,54 @@ fn test_path_without_extension() {
     );
 }
 
+#[test]
+fn test_diff_paths_directories_prefix_nested_paths() {
+    let root = std::env::temp_dir().join(format!("diffai_dir_diff_{}", std::process::id()));
+    let old_dir = root.join("old");
+    let new_dir = root.join("new");
+    for dir in [&old_dir, &new_dir] {
+        std::fs::create_dir_all(dir.join("sub").join("dir")).unwrap();
+    }
+
+    // .ptはバイト列のヒューリスティック解析のみなので、任意の内容でパースできる
+    std::fs::write(old_dir.join("sub/dir/model.pt"), b"conv1.weight fc.bias").unwrap();
+    std::fs::write(
+        new_dir.join("sub/dir/model.pt"),
+        b"conv1.weight fc.bias bn1 batch_norm",
+    )
+    .unwrap();
+    std::fs::write(old_dir.join("sub/dir/old_only.pt"), b"conv1.weight").unwrap();
+    std::fs::write(new_dir.join("sub/dir/new_only.pt"), b"fc.bias").unwrap();
+
+    let results = diff_paths(&old_dir, &new_dir, None);
+    std::fs::remove_dir_all(&root).unwrap();
+    let results = results.unwrap();
+
+    assert!(results
+        .iter()
+        .any(|r| matches!(r, DiffResult::Removed(path, _) if path == "sub/dir/old_only.pt")));
+    assert!(results
+        .iter()
+        .any(|r| matches!(r, DiffResult::Added(path, _) if path == "sub/dir/new_only.pt")));
+
+    let modified_paths: Vec<&String> = results
+        .iter()
+        .filter_map(|r| match r {
+            DiffResult::Modified(path, _, _) => Some(path),
+            _ => None,
+        })
+        .collect();
+    assert!(modified_paths
+        .iter()
+        .any(|path| path.as_str() == "sub/dir/model.pt/file_size"));
+    assert!(
+        modified_paths
+            .iter()
+            .all(|path| path.starts_with("sub/dir/model.pt/")),
+        "Modified paths should carry the relative file prefix: {modified_paths:?}"
+    );
+}
+
 // ============================================================================
 // MEMORY OPTIMIZATION TESTS
 // ============================================================================